@@ -1,11 +1,12 @@
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.types import TextContent, ImageContent
 from typing import Literal, Dict, Any, Optional
-import logging, os, asyncio, tempfile, hashlib, time
+import logging, os, asyncio, tempfile, secrets
 import io, base64
 from pathlib import Path
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib as mpl
+from matplotlib.figure import Figure
 from typing import List, Optional, Dict, Any
 from src.inputs import *
 from src.plot import *
@@ -21,6 +22,9 @@ logger = logging.getLogger(__name__)
 # Initialize MCP server
 mcp = FastMCP()
 
+# rcParams are global, apply the plot style once instead of per request
+set_mpl_style()
+
 def check_mcp_status(run_dir: str) -> Dict[str, Any]:
     """
     Check if an MCP run has finished or is still incomplete.
@@ -85,11 +89,18 @@ def _make_run_dir(base: Optional[str] = None) -> Path:
         base = tempfile.gettempdir()
     base = Path(base)
 
-    uniq = hashlib.sha1(f"{time.time_ns()}_{os.getpid()}".encode()).hexdigest()[:12]
+    uniq = secrets.token_hex(6)
     run_dir = base / "mcpruns" / uniq   # <-- no leading slash
     run_dir.mkdir(parents=True, exist_ok=False)
     return Path(run_dir)
 
+def _read_tail(path: Path, nbytes: int = 65536) -> bytes:
+    """Return at most the last nbytes of a file."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(f.tell() - nbytes, 0))
+        return f.read()
+
 @mcp.tool(
     name="get_multiplet_ground_state", 
     description="return ground state information of a multiplet calculation"
@@ -155,11 +166,11 @@ def plot_RIXS_result(
     -------
     Image of RIXS plot in png format
     """
-    set_mpl_style()
     check_pol(polarization_in)
     check_pol(polarization_out)
     x, y, z = get_RIXS_iter_all(run_dir,pvin=polarization_in,pvout=polarization_out)
-    fig, ax = plt.subplots(figsize=(8,8))
+    fig = Figure(figsize=(8,8))
+    ax = fig.add_subplot()
     if (energy_loss):
         ax.pcolormesh(x,y,z,cmap="terrain")
         ax.set_ylim([-2,10])
@@ -170,7 +181,7 @@ def plot_RIXS_result(
     else:
         ax.pcolormesh(x-y,x,z,cmap="terrain")
         lims = np.linspace(-1000,1000,1000)
-        plt.plot(lims,lims,ls="--",c="yellow",lw=2.5)
+        ax.plot(lims,lims,ls="--",c="yellow",lw=2.5)
         ax.set_xlim(np.min(x-y),np.max(x-y))
         ax.set_ylim(np.min(x),np.max(x))
         ax.set_ylabel("Incident Energy (eV)")
@@ -180,18 +191,15 @@ def plot_RIXS_result(
         ax.set_xlim(xlim)
     if ylim is not None:
         ax.set_ylim(ylim)
-    ax.set_facecolor(plt.cm.terrain(0))
+    ax.set_facecolor(mpl.colormaps["terrain"](0))
     ax.set_title("RIXS")
 
     # Save to buffer
     buf = io.BytesIO()
     fig.savefig(buf, format="png", bbox_inches="tight")
-    buf.seek(0)
-    img_bytes = buf.read()
-    plt.close(fig)
 
-    # Encode to base64 string
-    img_base64 = base64.b64encode(img_bytes).decode("utf-8")
+    # Encode to base64 string straight from the buffer, no intermediate copy
+    img_base64 = base64.b64encode(buf.getbuffer()).decode("ascii")
     # Return MCP-compatible image
     return ImageContent(
                 data=img_base64,
@@ -223,10 +231,10 @@ def plot_XAS_result(
     -------
     Image of XAS plot in png format
     """
-    set_mpl_style()
     check_pol(polarization)
     x, y = read_dir_xas(run_dir,pol=polarization)
-    fig, ax = plt.subplots(figsize=(8,6))
+    fig = Figure(figsize=(8,6))
+    ax = fig.add_subplot()
     ax.plot(x, y, lw = 2.5)
     ax.set_xlim(x[0],x[-1])
     ax.set_yticks([])
@@ -238,12 +246,9 @@ def plot_XAS_result(
     # Save to buffer
     buf = io.BytesIO()
     fig.savefig(buf, format="png", bbox_inches="tight")
-    buf.seek(0)
-    img_bytes = buf.read()
-    plt.close(fig)
 
-    # Encode to base64 string
-    img_base64 = base64.b64encode(img_bytes).decode("utf-8")
+    # Encode to base64 string straight from the buffer, no intermediate copy
+    img_base64 = base64.b64encode(buf.getbuffer()).decode("ascii")
     # Return MCP-compatible image
     return ImageContent(
                 type="image",
@@ -318,14 +323,17 @@ async def generate_multiplet_input(
     if input_params is None:
         input_params = InputParams()
     else:
-        input_params = InputParams(**input_params.model_dump())
+        # Already validated by the MCP layer, sections are frozen so a shallow copy is enough
+        input_params = input_params.model_copy()
 
     if tenDQ is not None:
-        input_params.CONTROL.CF = [0, 0, tenDQ, tenDQ, tenDQ]
+        input_params.CONTROL = input_params.CONTROL.model_copy(
+            update={"CF": (0, 0, tenDQ, tenDQ, tenDQ)}
+        )
 
 
     holes, dcontrol = get_dParams(Element, Valence)
-    input_params.CELL.Holes = holes
+    input_params.CELL = input_params.CELL.model_copy(update={"Holes": holes})
     input_params.CONTROL = input_params.CONTROL.model_copy(update=dcontrol)
 
     input_text = create_multiplet_input(input_params)   
@@ -376,8 +384,8 @@ async def run_multiplet_binary(
         {
             "cmd": str, # Command used
             "exit_code": proc.returncode,
-            "stdout": stdout_bytes.decode("utf-8", errors="replace"),
-            "stderr": stderr_bytes.decode("utf-8", errors="replace"),
+            "stdout": str, # last 64 KB of ed.out
+            "stderr": str, # last 64 KB of ed.err
             "out_dir": str | None   # directory where file was saved, if applicable
         }
     """
@@ -413,36 +421,29 @@ async def run_multiplet_binary(
         env.update(env_vars)
 
     try:
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=run_dir,
-            env=env,
-        )
-
-        try:
-            stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                proc.communicate(), timeout=timeout
+        # Child writes ed.out/ed.err directly, nothing is buffered in this process
+        with open(output_file, "wb") as f_out, open(error_file, "wb") as f_err:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=f_out,
+                stderr=f_err,
+                cwd=run_dir,
+                env=env,
             )
-        except asyncio.TimeoutError:
-            proc.kill()
-            await proc.wait()
-            raise RuntimeError(f"Binary timed out after {timeout:.1f} seconds (killed).")
-
-        # Save stdout to ed.out for compatibility with your workflow
-        with open(output_file, "wb") as f:
-            f.write(stdout_bytes)
 
-        with open(error_file, "wb") as f:
-            f.write(stderr_bytes)
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise RuntimeError(f"Binary timed out after {timeout:.1f} seconds (killed).")
 
         return {
             "cmd": cmd,
             "cwd": str(run_dir),
             "exit_code": proc.returncode,
-            "stdout": stdout_bytes.decode("utf-8", errors="replace"),
-            "stderr": stderr_bytes.decode("utf-8", errors="replace"),
+            "stdout": _read_tail(output_file).decode("utf-8", errors="replace"),
+            "stderr": _read_tail(error_file).decode("utf-8", errors="replace"),
             "out_dir": run_dir,
         }
 
@@ -1,6 +1,9 @@
-import json
-from pydantic import BaseModel, Field
-from typing import TypedDict, Optional, List
+import functools
+import math
+import operator
+from types import MappingProxyType
+from pydantic import BaseModel, ConfigDict, Field
+from typing import TypedDict, Optional, Tuple
 
 """
     Author: Sean Hsu
@@ -10,27 +13,176 @@ This file contains functions to generate input scripts for CTHFAM code
 
 ### These Pydantic Classes Limit the behavior of LLM
 class ControlParams(BaseModel):
-    CF: List[float] = [0, 0, 1, 1, 1]          # Crystal field values
-    SO: List[float] = [0, 0, 0]
-    SC2: List[float] = [0, 0, 0, 0, 0]
-    SC2EX: List[float] = [0, 0, 0, 0, 0]
-    FG: List[float] = [0, 0, 0, 0]
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    CF: Tuple[float, ...] = (0, 0, 1, 1, 1)          # Crystal field values
+    SO: Tuple[float, ...] = (0, 0, 0)
+    SC2: Tuple[float, ...] = (0, 0, 0, 0, 0)
+    SC2EX: Tuple[float, ...] = (0, 0, 0, 0, 0)
+    FG: Tuple[float, ...] = (0, 0, 0, 0)
 
 class CellParams(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     Holes: int
 
 class PhotonParams(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     XAS: bool = True
     RIXS: bool = False
-    pvin: List[int] = [1, 1, 1]
-    pvout: List[int] = [1, 1, 1]
+    pvin: Tuple[int, ...] = (1, 1, 1)
+    pvout: Tuple[int, ...] = (1, 1, 1)
     epsab: float = 0.5
     epsloss: float = 0.3
 
 class InputParams(BaseModel):
-    CONTROL: ControlParams = ControlParams()
-    CELL: CellParams = CellParams(Holes=0)
-    PHOTON: PhotonParams = PhotonParams()
+    # Sections are frozen, update them with model_copy(update=...)
+    CONTROL: ControlParams = Field(default_factory=ControlParams)
+    CELL: CellParams = Field(default_factory=lambda: CellParams(Holes=0))
+    PHOTON: PhotonParams = Field(default_factory=PhotonParams)
+
+def build_params(**kwargs):
+    """
+    Build InputParams from trusted internal values, skipping pydantic validation.
+    Sections can be given either as models or as plain dictionaries.
+    Nothing is checked, so required fields (CELL needs Holes) must be given and
+    values must already have the field types, e.g. CELL={"Holes": 5}.
+    """
+    section_models = {"CONTROL": ControlParams, "CELL": CellParams, "PHOTON": PhotonParams}
+    return InputParams.model_construct(**{
+        section: section_models[section].model_construct(**value) if isinstance(value, dict) else value
+        for section, value in kwargs.items()
+    })
+
+def load_input_params(raw):
+    """
+    Parse and validate InputParams from a JSON string or bytes in a single pass.
+    """
+    return InputParams.model_validate_json(raw)
+
+# Default values for all parameters
+_DEFAULTS = {
+    "CONTROL": {
+        "HFscale": 0.8,
+        "DIAG": 4,
+        "OVERWRITE": False,
+        "EFFDEL": True,
+        "CF": [0, 0, 1, 1, 1],
+        "EXNEV": 10,
+        "GSNEV": 10,
+        # Below are options for hybridized system
+        # "tpdzr": 1,
+        # "MLCT": 16.8196,
+        # "tpd": 1.1,
+        # "tpp": 0,
+        # "sigpi": 0.5,
+    },
+    "CELL": {
+        "Coordination": "",
+        "Sites": 1,
+        "HYBMAT": "",
+        "Holes": 0
+    },
+    "PHOTON": {
+        "XAS": True,
+        "RIXS": False,
+        "pvin": [1, 1, 1],
+        "pvout": [1, 1, 1],
+        "solver": 4,
+        "epsab": 0.5,
+        "epsloss": 0.3,
+        "niterCFE": 120,
+        "CGTOL": 1e-8,
+        "precond": 0,
+        "NEDOS": 2000,
+        "AB": [-20, 20],
+        "ABMAX": 30, # Use ABMAX as default
+        "INCIDENT": [8, 21, -1],
+        "CROSS": False,
+        "Edge": "L"
+    }
+}
+
+def _format_list(value):
+    return " ".join(map(str, value))
+
+def _format_str(value):
+    return f'"{value}"' if value else '""'
+
+def _get_formatter(key, value):
+    """
+    Pick how a parameter is written to the INPUT file, decided once per key.
+    """
+    if isinstance(value, (list, tuple)):
+        return _format_list
+    if isinstance(value, str):
+        if key.upper() == "EDGE": # Quirk of my code...
+            return lambda v: f'{v}' if v else '""'
+        return _format_str
+    return str # bool and numbers
+
+def _tag(value):
+    # 0.0 == -0.0 with the same hash, the sign has to be part of the key as well
+    if isinstance(value, float):
+        return type(value), math.copysign(1.0, value)
+    return type(value)
+
+def _freeze(value):
+    # Type is part of the key: True == 1 == 1.0 but they are written differently
+    if isinstance(value, (list, tuple)):
+        return tuple(value), tuple(map(_tag, value))
+    return value, _tag(value)
+
+def _build_tables():
+    # Keys come from the defaults above plus every field of the pydantic models,
+    # default lines are rendered once here and only overrides are formatted per call
+    models = InputParams().model_dump()
+    formatters, default_values, default_lines = {}, {}, {}
+    for section in _DEFAULTS:
+        params = {**_DEFAULTS[section], **models[section]}
+        formatters[section] = {
+            key: (f"\t{key.upper()} = ", _get_formatter(key, value))
+            for key, value in params.items()
+        }
+        default_values[section] = {key: _freeze(value) for key, value in params.items()}
+        default_lines[section] = {
+            key: prefix + fmt(params[key]) for key, (prefix, fmt) in formatters[section].items()
+        }
+    return formatters, default_values, default_lines
+
+_FORMATTERS, _DEFAULT_VALUES, _DEFAULT_LINES = _build_tables()
+_SECTION_HEADERS = {section: f"&{section.upper()}\n" for section in _DEFAULTS}
+
+def _render_from_tuple(signature):
+    """
+    Render the INPUT text from a hashable signature,
+    (section, ((key, (value, types)), ...)) for every section.
+    """
+    sections = []
+
+    for section, section_items in signature:
+        # Start from the pre-rendered defaults, only reformat keys that differ
+        default_values = _DEFAULT_VALUES[section]
+        formatters = _FORMATTERS[section]
+        lines = dict(_DEFAULT_LINES[section])
+
+        for key, frozen in section_items:
+            if default_values.get(key) == frozen:
+                continue
+            prefix, fmt = formatters[key]
+            precomputed = _PRECOMPUTED_STRINGS.get(frozen)
+            lines[key] = prefix + (precomputed if precomputed is not None else fmt(frozen[0]))
+        sections.append(_SECTION_HEADERS[section] + "\n".join(lines.values()) + "\n/\n")
+
+    # Sections are separated by a blank line
+    return "\n".join(sections)
+
+_SECTION_NAMES = ("CONTROL", "CELL", "PHOTON")
+_SECTION_GETTER = operator.attrgetter(*_SECTION_NAMES)
+
+# Sweeps regenerate the same input over and over, memoize the rendered text
+_render_cached = functools.lru_cache(maxsize=256)(_render_from_tuple)
 
 def create_multiplet_input(input_params):
     """
@@ -44,85 +196,298 @@ def create_multiplet_input(input_params):
         str: The content of the MCP INPUT file.
     """
 
-    # Default values for all parameters
-    defaults = {
-        "CONTROL": {
-            "HFscale": 0.8,
-            "DIAG": 4,
-            "OVERWRITE": False,
-            "EFFDEL": True,
-            "CF": [0, 0, 1, 1, 1],
-            "EXNEV": 10,
-            "GSNEV": 10,
-            # Below are options for hybridized system
-            # "tpdzr": 1,
-            # "MLCT": 16.8196,
-            # "tpd": 1.1,
-            # "tpp": 0,
-            # "sigpi": 0.5,
-        },
-        "CELL": {
-            "Coordination": "",
-            "Sites": 1,
-            "HYBMAT": "",
-            "Holes": 0
-        },
-        "PHOTON": {
-            "XAS": True,
-            "RIXS": False,
-            "pvin": [1, 1, 1],
-            "pvout": [1, 1, 1],
-            "solver": 4,
-            "epsab": 0.5,
-            "epsloss": 0.3,
-            "niterCFE": 120,
-            "CGTOL": 1e-8,
-            "precond": 0,
-            "NEDOS": 2000,
-            "AB": [-20, 20],
-            "ABMAX": 30, # Use ABMAX as default
-            "INCIDENT": [8, 21, -1],
-            "CROSS": False,
-            "Edge": "L"
-        }
-    }
+    signature = []
+
+    for section, section_model in zip(_SECTION_NAMES, _SECTION_GETTER(input_params)):
+        # Plain attribute reads, no need for a full pydantic serialization pass
+        section_items = tuple(
+            (k, _freeze(getattr(section_model, k))) for k in type(section_model).model_fields
+        )
+        signature.append((section, section_items))
+
+    return _render_cached(tuple(signature))
+
+# Values taken from Haverkort's thesis. 
+# 3d SO for ground state is omitted for speed
+_RAW_ATOMIC_DATA = {
+    "Zn": {
+        3: {
+            "SO": [15.738, 0.162, 0],
+            "SC2": [4.5, 0.0, 14.489, 0.0, 9.041],
+            "SC2EX": [4.5, 0.0, 15.210, 0.0, 9.495],
+            "FG": [4.5, 7.084, 15.738, 4.033],
+        },
+        4: {
+            "SO": [15.737, 0.175, 0],
+            "SC2": [4.5, 0.0, 15.443, 0.0, 9.681],
+            "SC2EX": [4.5, 0.0, 16.145, 0.0, 10.124],
+            "FG": [4.5, 7.639, 15.737, 4.352],
+        },
+    },
+    "Cu": {
+        2: {
+            "SO": [13.498, 0.124, 0],
+            "SC2": [4.5, 0.0, 12.854, 0.0, 7.980],
+            "SC2EX": [4.5, 0.0, 13.611, 0.0, 8.457],
+            "FG": [4.5, 6.169, 13.498, 3.510],
+        },
+        3: {
+            "SO": [13.496, 0.135, 0],
+            "SC2": [4.5, 0.0, 13.885, 0.0, 8.669],
+            "SC2EX": [4.5, 0.0, 14.617, 0.0, 9.130],
+            "FG": [4.5, 6.708, 13.496, 3.818],
+        },
+        4: {
+            "SO": [13.495, 0.147, 0],
+            "SC2": [4.5, 0.0, 14.845, 0.0, 9.313],
+            "SC2EX": [4.5, 0.0, 15.556, 0.0, 9.762],
+            "FG": [4.5, 7.270, 13.495, 4.141],
+        },
+    },
+    "Ni": {
+        1: { 
+            "SO": [11.509, 0.093, 0],               
+            "SC2": [4.5, 0.0, 11.084, 0.0, 6.835],
+            "SC2EX": [4.5, 0.0, 11.890, 0.0, 7.343],
+            "FG": [4.5, 5.262, 7.098, 2.993],
+        },
+        2: {
+            "SO": [11.507, 0.102, 0],
+            "SC2": [4.5, 0.0, 12.233 , 0.0, 7.597],
+            "SC2EX": [4.5, 0.0, 13.005, 0.0, 8.084],
+            "FG": [4.5, 5.783, 7.720, 3.290],
+        },
+        3: {
+            "SO": [11.506, 0.112, 0],
+            "SC2": [4.5, 0.0, 13.276, 0.0, 8.294],
+            "SC2EX": [4.5, 0.0, 14.021, 0.0, 8.763],
+            "FG": [4.5, 6.329, 8.349, 3.602],
+        },
+        4: {
+            "SO": [11.505, 0.122, 0],
+            "SC2": [4.5, 0.0, 14.244, 0.0, 8.944],
+            "SC2EX": [4.5, 0.0, 14.965, 0.0, 9.399],
+            "FG": [4.5, 6.898, 8.984, 3.929],
+        },
+    },
+    "Co": {
+        0: {
+            "SO": [9.752, 0.067, 0],
+            "SC2": [4.5, 0.0, 2.196, 0.0, 1.348],
+            "SC2EX": [4.5, 0.0, 9.969, 0.0, 6.108],
+            "FG": [4.5, 4.367, 5.996, 2.482],
+        },
+        1: {
+            "SO": [9.750, 0.075, 0],
+            "SC2": [4.5, 0.0, 10.430, 0.0, 6.431],
+            "SC2EX": [4.5, 0.0, 11.261, 0.0, 6.954],
+            "FG": [4.5, 4.865, 6.624, 2.766],
+        },
+        2: {
+            "SO": [9.748, 0.083, 0],
+            "SC2": [4.5, 0.0, 11.604, 0.0, 7.209],
+            "SC2EX": [4.5, 0.0, 12.395, 0.0, 7.707],
+            "FG": [4.5, 5.394, 7.259, 3.068],
+        },
+        3: {
+            "SO": [9.746, 0.092, 0],
+            "SC2": [4.5, 0.0, 12.662, 0.0, 7.916],
+            "SC2EX": [4.5, 0.0, 13.421, 0.0, 8.394],
+            "FG": [4.5, 5.947, 7.899, 3.384],
+        },
+        4: {
+            "SO": [9.746, 0.101, 0],
+            "SC2": [4.5, 0.0, 13.638, 0.0, 8.572],
+            "SC2EX": [4.5, 0.0, 14.372, 0.0, 9.034],
+            "FG": [4.5, 6.525, 8.544, 3.716],
+        },
+    },
+    "Fe": {
+        0: {
+            "SO": [8.203, 0.053, 0],
+            "SC2": [4.5, 0.0, 2.087, 0.0, 1.275],
+            "SC2EX": [4.5, 0.0, 9.293, 0.0, 5.688],
+            "FG": [4.5, 3.957, 8.203, 2.248],
+        },
+        1: {
+            "SO": [8.202, 0.059, 0],
+            "SC2": [4.5, 0.0, 9.761, 0.0, 6.017],
+            "SC2EX": [4.5, 0.0, 10.622, 0.0, 6.559],
+            "FG": [4.5, 4.463, 8.202, 2.537],
+        },
+        2: {
+            "SO": [8.200, 0.067, 0],
+            "SC2": [4.5, 0.0, 10.965, 0.0, 6.815],
+            "SC2EX": [4.5, 0.0, 11.778, 0.0, 7.327],
+            "FG": [4.5, 5.000, 8.200, 2.843],
+        },
+        3: {
+            "SO": [8.199, 0.074, 0],
+            "SC2": [4.5, 0.0, 12.042, 0.0, 7.534],
+            "SC2EX": [4.5, 0.0, 12.817, 0.0, 8.023],
+            "FG": [4.5, 5.563, 8.199, 3.165],
+        },
+        4: {
+            "SO": [8.199, 0.082, 0],
+            "SC2": [4.5, 0.0, 13.029, 0.0, 8.197],
+            "SC2EX": [4.5, 0.0, 13.775, 0.0, 8.667],
+            "FG": [4.5, 6.150, 8.199, 3.502],
+        },
+    },
+    "Mn": {
+        0: {
+            "SO": [6.849, 0.040, 0],
+            "SC2": [4.5, 0.0, 5.312, 0.0, 3.268],
+            "SC2EX": [4.5, 0.0, 8.594, 0.0, 5.255],
+            "FG": [4.5, 3.539, 6.849, 2.010],
+        },
+        1: {
+            "SO": [6.847, 0.046, 0],
+            "SC2": [4.5, 0.0, 9.072, 0.0, 5.590],
+            "SC2EX": [4.5, 0.0, 9.971, 0.0, 6.156],
+            "FG": [4.5, 4.056, 6.847, 2.304],
+        },
+        2: {
+            "SO": [6.846, 0.053, 0],
+            "SC2": [4.5, 0.0, 10.315, 0.0, 6.413],
+            "SC2EX": [4.5, 0.0, 11.154, 0.0, 6.942],
+            "FG": [4.5, 4.603, 6.846, 2.617],
+        },
+        3: {
+            "SO": [6.845, 0.059, 0],
+            "SC2": [4.5, 0.0, 11.414, 0.0, 7.147],
+            "SC2EX": [4.5, 0.0, 12.209, 0.0, 7.648],
+            "FG": [4.5, 5.176, 6.845, 2.944],
+        },
+        4: {
+            "SO": [6.845, 0.066, 0],
+            "SC2": [4.5, 0.0, 12.414, 0.0, 7.819],
+            "SC2EX": [4.5, 0.0, 13.176, 0.0, 8.299],
+            "FG": [4.5, 5.773, 6.845, 3.287],
+        },
+    },
+    "Cr": {
+        0: {
+            "SO": [5.671, 0.030, 0],
+            "SC2": [4.5, 0.0, 6.833, 0.0, 4.155],
+            "SC2EX": [4.5, 0.0, 7.866, 0.0, 4.803],
+            "FG": [4.5, 3.112, 5.671, 1.767],
+        },
+        1: {
+            "SO": [5.669, 0.035, 0],
+            "SC2": [4.5, 0.0, 8.355, 0.0, 5.146],
+            "SC2EX": [4.5, 0.0, 9.303, 0.0, 5.742],
+            "FG": [4.5, 3.641, 5.669, 2.068],
+        },
+        2: {
+            "SO": [5.668, 0.041, 0],
+            "SC2": [4.5, 0.0, 9.648, 0.0, 6.001],
+            "SC2EX": [4.5, 0.0, 10.521, 0.0, 6.551],
+            "FG": [4.5, 4.201, 5.668, 2.387],
+        },
+        3: {
+            "SO": [5.667, 0.047, 0],
+            "SC2": [4.5, 0.0, 10.776, 0.0, 6.754],
+            "SC2EX": [4.5, 0.0, 11.594, 0.0, 7.270],
+            "FG": [4.5, 4.785, 5.667, 2.721],
+        },
+        4: {
+            "SO": [5.668, 0.053, 0],
+            "SC2": [4.5, 0.0, 11.793, 0.0, 7.437],
+            "SC2EX": [4.5, 0.0, 12.572, 0.0, 7.928],
+            "FG": [4.5, 5.394, 5.668, 3.070],
+        },
+    },
+    "V": {
+        0: {
+            "SO": [4.652, 0.022, 0],
+            "SC2": [4.5, 0.0, 5.970, 0.0, 3.620],
+            "SC2EX": [4.5, 0.0, 7.095, 0.0, 4.324],
+            "FG": [4.5, 2.673, 4.652, 1.517],
+        },
+        1: {
+            "SO": [4.651, 0.026, 0],
+            "SC2": [4.5, 0.0, 7.599, 0.0, 4.676],
+            "SC2EX": [4.5, 0.0, 8.612, 0.0, 5.314],
+            "FG": [4.5, 3.218, 4.651, 1.827],
+        },
+        2: {
+            "SO": [4.650, 0.031, 0],
+            "SC2": [4.5, 0.0, 8.961, 0.0, 5.576],
+            "SC2EX": [4.5, 0.0, 9.875, 0.0, 6.152],
+            "FG": [4.5, 3.792, 4.650, 2.154],
+        },
+        3: {
+            "SO": [4.649, 0.036, 0],
+            "SC2": [4.5, 0.0, 10.126, 0.0, 6.353],
+            "SC2EX": [4.5, 0.0, 10.973, 0.0, 6.887],
+            "FG": [4.5, 4.389, 4.649, 2.495],
+        },
+        4: {
+            "SO": [4.650, 0.041, 0],
+            "SC2": [4.5, 0.0, 0.000, 0.0, 0.000],
+            "SC2EX": [4.5, 0.0, 11.963, 0.0, 7.554],
+            "FG": [4.5, 5.011, 4.650, 2.852],
+        },
+    },
+    "Ti": {
+        0: {
+            "SO": [3.778, 0.015, 0],
+            "SC2": [4.5, 0.0, 5.002, 0.0, 3.019],
+            "SC2EX": [4.5, 0.0, 6.261, 0.0, 3.806],
+            "FG": [4.5, 2.216, 3.778, 1.257],
+        },
+        1: {
+            "SO": [3.777, 0.019, 0],
+            "SC2": [4.5, 0.0, 6.780, 0.0, 4.167],
+            "SC2EX": [4.5, 0.0, 7.888, 0.0, 4.865],
+            "FG": [4.5, 2.783, 3.777, 1.578],
+        },
+        2: {
+            "SO": [3.776, 0.023, 0],
+            "SC2": [4.5, 0.0, 8.243, 0.0, 5.132],
+            "SC2EX": [4.5, 0.0, 9.213, 0.0, 5.744],
+            "FG": [4.5, 3.376, 3.776, 1.917],
+        },
+        3: {
+            "SO": [3.776, 0.027, 0],
+            "SC2": [4.5, 0.0, 0.0, 0.0, 0.0],
+            "SC2EX": [4.5, 0.0, 10.342, 0.0, 6.499],
+            "FG": [4.5, 3.989, 3.776, 2.267],
+        },
+    },
+    # Add more elements/valences here...
+}
+
+_ZERO_VAL = {
+    "Zn": -2,
+    "Cu": -1,
+    "Ni":  0,
+    "Co":  1,
+    "Fe":  2,
+    "Mn":  3,
+    "Cr":  4,
+    "V":   5,
+    "Ti":  6
+}
 
-    output_lines = []
-
-    for section in ["CONTROL", "CELL", "PHOTON"]:
-        output_lines.append(f"&{section.upper()}")
-        # section_params = input_params.get(section, {})
-        
-        # # Use provided parameters, falling back to defaults
-        # all_params = {**defaults.get(section, {}), **section_params}
-
-        section_model = getattr(input_params, section, None)
-        section_dict = section_model.model_dump() if section_model else {}
-
-        # Merge defaults with user-provided values
-        all_params = {**defaults.get(section, {}), **section_dict}
-
-        for key, value in all_params.items():
-            # Format the value for the INPUT file
-            if isinstance(value, list):
-                formatted_value = " ".join(map(str, value))
-            elif isinstance(value, bool):
-                formatted_value = str(value)
-            elif isinstance(value, str) and value:
-                if key == "Edge" or key == "EDGE": # Quirk of my code...
-                    formatted_value = f'{value}'
-                else:
-                    formatted_value = f'"{value}"'
-            elif value == "":
-                formatted_value = f'""'
-            else:
-                formatted_value = str(value)
-
-            output_lines.append(f"\t{key.upper()} = {formatted_value}")
-        output_lines.append("/")
-        output_lines.append("")
-
-    return "\n".join(output_lines)
+# Flat lookup keyed by (element, valence) -> (holes, CONTROL values), vectors are
+# frozen so every caller can share the same objects without copying
+_ATOMIC_DATA = {
+    (element, valence): (
+        _ZERO_VAL[element]+valence,
+        MappingProxyType({key: tuple(vec) for key, vec in data.items()}),
+    )
+    for element, valences in _RAW_ATOMIC_DATA.items()
+    for valence, data in valences.items()
+}
+
+# Atomic vectors are constants, stringify them once for the INPUT renderer
+_PRECOMPUTED_STRINGS = {
+    _freeze(vec): _format_list(vec)
+    for _, data in _ATOMIC_DATA.values()
+    for vec in data.values()
+}
 
 def get_dParams(element: str, valence: int):
     """
@@ -133,277 +498,13 @@ def get_dParams(element: str, valence: int):
         valence (int): Oxidation state (e.g. 2, 3).
 
     Returns:
-        dict: Dictionary of CONTROL section values.
+        tuple: Number of holes and a read-only mapping of CONTROL section values.
     """
 
-    # Values taken from Haverkort's thesis. 
-    # 3d SO for ground state is omitted for speed
-    atomic_data = {
-       "Zn": {
-            3: {
-                "SO": [15.738, 0.162, 0],
-                "SC2": [4.5, 0.0, 14.489, 0.0, 9.041],
-                "SC2EX": [4.5, 0.0, 15.210, 0.0, 9.495],
-                "FG": [4.5, 7.084, 15.738, 4.033],
-            },
-            4: {
-                "SO": [15.737, 0.175, 0],
-                "SC2": [4.5, 0.0, 15.443, 0.0, 9.681],
-                "SC2EX": [4.5, 0.0, 16.145, 0.0, 10.124],
-                "FG": [4.5, 7.639, 15.737, 4.352],
-            },
-        },
-        "Cu": {
-            2: {
-                "SO": [13.498, 0.124, 0],
-                "SC2": [4.5, 0.0, 12.854, 0.0, 7.980],
-                "SC2EX": [4.5, 0.0, 13.611, 0.0, 8.457],
-                "FG": [4.5, 6.169, 13.498, 3.510],
-            },
-            3: {
-                "SO": [13.496, 0.135, 0],
-                "SC2": [4.5, 0.0, 13.885, 0.0, 8.669],
-                "SC2EX": [4.5, 0.0, 14.617, 0.0, 9.130],
-                "FG": [4.5, 6.708, 13.496, 3.818],
-            },
-            4: {
-                "SO": [13.495, 0.147, 0],
-                "SC2": [4.5, 0.0, 14.845, 0.0, 9.313],
-                "SC2EX": [4.5, 0.0, 15.556, 0.0, 9.762],
-                "FG": [4.5, 7.270, 13.495, 4.141],
-            },
-        },
-        "Ni": {
-            1: { 
-                "SO": [11.509, 0.093, 0],               
-                "SC2": [4.5, 0.0, 11.084, 0.0, 6.835],
-                "SC2EX": [4.5, 0.0, 11.890, 0.0, 7.343],
-                "FG": [4.5, 5.262, 7.098, 2.993],
-            },
-            2: {
-                "SO": [11.507, 0.102, 0],
-                "SC2": [4.5, 0.0, 12.233 , 0.0, 7.597],
-                "SC2EX": [4.5, 0.0, 13.005, 0.0, 8.084],
-                "FG": [4.5, 5.783, 7.720, 3.290],
-            },
-            3: {
-                "SO": [11.506, 0.112, 0],
-                "SC2": [4.5, 0.0, 13.276, 0.0, 8.294],
-                "SC2EX": [4.5, 0.0, 14.021, 0.0, 8.763],
-                "FG": [4.5, 6.329, 8.349, 3.602],
-            },
-            4: {
-                "SO": [11.505, 0.122, 0],
-                "SC2": [4.5, 0.0, 14.244, 0.0, 8.944],
-                "SC2EX": [4.5, 0.0, 14.965, 0.0, 9.399],
-                "FG": [4.5, 6.898, 8.984, 3.929],
-            },
-        },
-        "Co": {
-            0: {
-                "SO": [9.752, 0.067, 0],
-                "SC2": [4.5, 0.0, 2.196, 0.0, 1.348],
-                "SC2EX": [4.5, 0.0, 9.969, 0.0, 6.108],
-                "FG": [4.5, 4.367, 5.996, 2.482],
-            },
-            1: {
-                "SO": [9.750, 0.075, 0],
-                "SC2": [4.5, 0.0, 10.430, 0.0, 6.431],
-                "SC2EX": [4.5, 0.0, 11.261, 0.0, 6.954],
-                "FG": [4.5, 4.865, 6.624, 2.766],
-            },
-            2: {
-                "SO": [9.748, 0.083, 0],
-                "SC2": [4.5, 0.0, 11.604, 0.0, 7.209],
-                "SC2EX": [4.5, 0.0, 12.395, 0.0, 7.707],
-                "FG": [4.5, 5.394, 7.259, 3.068],
-            },
-            3: {
-                "SO": [9.746, 0.092, 0],
-                "SC2": [4.5, 0.0, 12.662, 0.0, 7.916],
-                "SC2EX": [4.5, 0.0, 13.421, 0.0, 8.394],
-                "FG": [4.5, 5.947, 7.899, 3.384],
-            },
-            4: {
-                "SO": [9.746, 0.101, 0],
-                "SC2": [4.5, 0.0, 13.638, 0.0, 8.572],
-                "SC2EX": [4.5, 0.0, 14.372, 0.0, 9.034],
-                "FG": [4.5, 6.525, 8.544, 3.716],
-            },
-        },
-        "Fe": {
-            0: {
-                "SO": [8.203, 0.053, 0],
-                "SC2": [4.5, 0.0, 2.087, 0.0, 1.275],
-                "SC2EX": [4.5, 0.0, 9.293, 0.0, 5.688],
-                "FG": [4.5, 3.957, 8.203, 2.248],
-            },
-            1: {
-                "SO": [8.202, 0.059, 0],
-                "SC2": [4.5, 0.0, 9.761, 0.0, 6.017],
-                "SC2EX": [4.5, 0.0, 10.622, 0.0, 6.559],
-                "FG": [4.5, 4.463, 8.202, 2.537],
-            },
-            2: {
-                "SO": [8.200, 0.067, 0],
-                "SC2": [4.5, 0.0, 10.965, 0.0, 6.815],
-                "SC2EX": [4.5, 0.0, 11.778, 0.0, 7.327],
-                "FG": [4.5, 5.000, 8.200, 2.843],
-            },
-            3: {
-                "SO": [8.199, 0.074, 0],
-                "SC2": [4.5, 0.0, 12.042, 0.0, 7.534],
-                "SC2EX": [4.5, 0.0, 12.817, 0.0, 8.023],
-                "FG": [4.5, 5.563, 8.199, 3.165],
-            },
-            4: {
-                "SO": [8.199, 0.082, 0],
-                "SC2": [4.5, 0.0, 13.029, 0.0, 8.197],
-                "SC2EX": [4.5, 0.0, 13.775, 0.0, 8.667],
-                "FG": [4.5, 6.150, 8.199, 3.502],
-            },
-        },
-        "Mn": {
-            0: {
-                "SO": [6.849, 0.040, 0],
-                "SC2": [4.5, 0.0, 5.312, 0.0, 3.268],
-                "SC2EX": [4.5, 0.0, 8.594, 0.0, 5.255],
-                "FG": [4.5, 3.539, 6.849, 2.010],
-            },
-            1: {
-                "SO": [6.847, 0.046, 0],
-                "SC2": [4.5, 0.0, 9.072, 0.0, 5.590],
-                "SC2EX": [4.5, 0.0, 9.971, 0.0, 6.156],
-                "FG": [4.5, 4.056, 6.847, 2.304],
-            },
-            2: {
-                "SO": [6.846, 0.053, 0],
-                "SC2": [4.5, 0.0, 10.315, 0.0, 6.413],
-                "SC2EX": [4.5, 0.0, 11.154, 0.0, 6.942],
-                "FG": [4.5, 4.603, 6.846, 2.617],
-            },
-            3: {
-                "SO": [6.845, 0.059, 0],
-                "SC2": [4.5, 0.0, 11.414, 0.0, 7.147],
-                "SC2EX": [4.5, 0.0, 12.209, 0.0, 7.648],
-                "FG": [4.5, 5.176, 6.845, 2.944],
-            },
-            4: {
-                "SO": [6.845, 0.066, 0],
-                "SC2": [4.5, 0.0, 12.414, 0.0, 7.819],
-                "SC2EX": [4.5, 0.0, 13.176, 0.0, 8.299],
-                "FG": [4.5, 5.773, 6.845, 3.287],
-            },
-        },
-        "Cr": {
-            0: {
-                "SO": [5.671, 0.030, 0],
-                "SC2": [4.5, 0.0, 6.833, 0.0, 4.155],
-                "SC2EX": [4.5, 0.0, 7.866, 0.0, 4.803],
-                "FG": [4.5, 3.112, 5.671, 1.767],
-            },
-            1: {
-                "SO": [5.669, 0.035, 0],
-                "SC2": [4.5, 0.0, 8.355, 0.0, 5.146],
-                "SC2EX": [4.5, 0.0, 9.303, 0.0, 5.742],
-                "FG": [4.5, 3.641, 5.669, 2.068],
-            },
-            2: {
-                "SO": [5.668, 0.041, 0],
-                "SC2": [4.5, 0.0, 9.648, 0.0, 6.001],
-                "SC2EX": [4.5, 0.0, 10.521, 0.0, 6.551],
-                "FG": [4.5, 4.201, 5.668, 2.387],
-            },
-            3: {
-                "SO": [5.667, 0.047, 0],
-                "SC2": [4.5, 0.0, 10.776, 0.0, 6.754],
-                "SC2EX": [4.5, 0.0, 11.594, 0.0, 7.270],
-                "FG": [4.5, 4.785, 5.667, 2.721],
-            },
-            4: {
-                "SO": [5.668, 0.053, 0],
-                "SC2": [4.5, 0.0, 11.793, 0.0, 7.437],
-                "SC2EX": [4.5, 0.0, 12.572, 0.0, 7.928],
-                "FG": [4.5, 5.394, 5.668, 3.070],
-            },
-        },
-        "V": {
-            0: {
-                "SO": [4.652, 0.022, 0],
-                "SC2": [4.5, 0.0, 5.970, 0.0, 3.620],
-                "SC2EX": [4.5, 0.0, 7.095, 0.0, 4.324],
-                "FG": [4.5, 2.673, 4.652, 1.517],
-            },
-            1: {
-                "SO": [4.651, 0.026, 0],
-                "SC2": [4.5, 0.0, 7.599, 0.0, 4.676],
-                "SC2EX": [4.5, 0.0, 8.612, 0.0, 5.314],
-                "FG": [4.5, 3.218, 4.651, 1.827],
-            },
-            2: {
-                "SO": [4.650, 0.031, 0],
-                "SC2": [4.5, 0.0, 8.961, 0.0, 5.576],
-                "SC2EX": [4.5, 0.0, 9.875, 0.0, 6.152],
-                "FG": [4.5, 3.792, 4.650, 2.154],
-            },
-            3: {
-                "SO": [4.649, 0.036, 0],
-                "SC2": [4.5, 0.0, 10.126, 0.0, 6.353],
-                "SC2EX": [4.5, 0.0, 10.973, 0.0, 6.887],
-                "FG": [4.5, 4.389, 4.649, 2.495],
-            },
-            4: {
-                "SO": [4.650, 0.041, 0],
-                "SC2": [4.5, 0.0, 0.000, 0.0, 0.000],
-                "SC2EX": [4.5, 0.0, 11.963, 0.0, 7.554],
-                "FG": [4.5, 5.011, 4.650, 2.852],
-            },
-        },
-        "Ti": {
-            0: {
-                "SO": [3.778, 0.015, 0],
-                "SC2": [4.5, 0.0, 5.002, 0.0, 3.019],
-                "SC2EX": [4.5, 0.0, 6.261, 0.0, 3.806],
-                "FG": [4.5, 2.216, 3.778, 1.257],
-            },
-            1: {
-                "SO": [3.777, 0.019, 0],
-                "SC2": [4.5, 0.0, 6.780, 0.0, 4.167],
-                "SC2EX": [4.5, 0.0, 7.888, 0.0, 4.865],
-                "FG": [4.5, 2.783, 3.777, 1.578],
-            },
-            2: {
-                "SO": [3.776, 0.023, 0],
-                "SC2": [4.5, 0.0, 8.243, 0.0, 5.132],
-                "SC2EX": [4.5, 0.0, 9.213, 0.0, 5.744],
-                "FG": [4.5, 3.376, 3.776, 1.917],
-            },
-            3: {
-                "SO": [3.776, 0.027, 0],
-                "SC2": [4.5, 0.0, 0.0, 0.0, 0.0],
-                "SC2EX": [4.5, 0.0, 10.342, 0.0, 6.499],
-                "FG": [4.5, 3.989, 3.776, 2.267],
-            },
-        },
-        # Add more elements/valences here...
-    }
-
-    zero_val = {
-        "Zn": -2,
-        "Cu": -1,
-        "Ni":  0,
-        "Co":  1,
-        "Fe":  2,
-        "Mn":  3,
-        "Cr":  4,
-        "V":   5,
-        "Ti":  6
-    }
-    holes = zero_val[element]+valence
-    if holes < 0:
-        raise ValueError(f"Invalid atomic configuration for {element} with valence {valence}")
-    
-    if element not in atomic_data or valence not in atomic_data[element]:
+    entry = _ATOMIC_DATA.get((element, valence))
+    if entry is None:
+        if _ZERO_VAL.get(element, 0)+valence < 0:
+            raise ValueError(f"Invalid atomic configuration for {element} with valence {valence}")
         raise ValueError(f"No atomic data found for {element} with valence {valence}")
 
-    return holes, atomic_data[element][valence]
+    return entry
@@ -2,8 +2,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib as mpl
 import os
+import functools
 from math import pi
-from numpy import genfromtxt
 from pathlib import Path
 import io
 import base64
@@ -19,13 +19,24 @@ only solver = 4 is allowed for mcp for simplicity
 """
 
 def _get_XAS_iter(filedir):
-    with open(filedir) as f:
-        xas = np.genfromtxt(f,usecols=np.arange(0,2))
-    x = xas[1:,0]
-    y = xas[1:,1]
+    # First row is the header, skip it instead of parsing it as NaN
+    xas = np.loadtxt(filedir,usecols=(0,1),skiprows=1,ndmin=2,dtype=np.float64)
+    x = xas[:,0]
+    y = xas[:,1]
     return x,y
 
 
+def _mtime_signature(fnames):
+    # Part of the cache key, rewriting any of the files invalidates the cached arrays
+    return tuple(os.stat(f).st_mtime_ns for f in fnames)
+
+def _freeze(*arrs):
+    # Cached arrays are shared between callers, make sure nobody edits them in place
+    for a in arrs:
+        if a is not None: a.setflags(write=False)
+    return arrs
+
+
 def read_dir_xas(dir_name,edge = "L",pol = "XYZ",extension=".txt",solver=4):
     """
     read XAS output file in the specified directory. outputs absorption (x), intensity (y)
@@ -35,42 +46,46 @@ def read_dir_xas(dir_name,edge = "L",pol = "XYZ",extension=".txt",solver=4):
         b: broadening
         edge: absorption edge
         pol: string of "XYZ" for example
+        solver: only the continuous curve output (solver = 4) is supported
     """
-    if (solver < 4): 
-        ydata = np.zeros(xdata.size)
+    if (solver < 4):
+        raise RuntimeError(f"Exact peak output (solver = {solver}) is not supported, use solver = 4")
+    filenames = []
     for p in pol:
         filename = dir_name+"/XAS_"+edge+"edge_"+p+extension
         if (Path(filename).exists() and Path(filename).is_file()):
-            ydata = 0
-            x,y = _get_XAS_iter(filename)
-            if (ydata == 0):
-                ydata = y
-            else: ydata = ydata + y
-            xdata = x
+            filenames.append(filename)
         else:
             raise RuntimeError(f"XAS file does not exist: {filename}, with polarization: {str(p)}")
-    return xdata,ydata
+    return _cached_dir_xas(tuple(filenames),_mtime_signature(filenames))
+
+@functools.lru_cache(maxsize=32)
+def _cached_dir_xas(filenames,mtime_sig):
+    xdata = None
+    ydata = None
+    for filename in filenames:
+        x,y = _get_XAS_iter(filename)
+        if (ydata is None):
+            xdata, ydata = x, y.copy()
+        else: np.add(ydata,y,out=ydata)
+    return _freeze(xdata,ydata)
 
 
 def _get_RIXS_iter(fname,wipe_loss=False):
     """
     Get rixs that are solved by iterative method (BiCGS)
     """
-    with open(fname) as f:
-        res_raman = np.genfromtxt(f,usecols=np.arange(0,3))
-    x = res_raman[1:,0]
-    y = res_raman[1:,1]
-    z = res_raman[1:,2]
+    res_raman = np.loadtxt(fname,usecols=(0,1,2),skiprows=1,ndmin=2,dtype=np.float64)
+    x = res_raman[:,0]
     if (wipe_loss):
-        for i in range(x.shape[0]):
-            if (x[i] < y[i]): z[i] = 0
-    for i in range(x.shape[0]):
-        if x[i] != x[0]: break
-        if (i == x.shape[0]-1): i = x.shape[0]
-    y_dim = int(x.shape[0]/i)
-    x = x.reshape((y_dim,i))
-    y = y.reshape((y_dim,i))
-    z = z.reshape((y_dim,i))
+        res_raman[x < res_raman[:,1],2] = 0
+    # Row length is where the first coordinate first changes (whole file if never)
+    i = int(np.argmax(x != x[0])) or x.shape[0]
+    y_dim = x.shape[0]//i
+    res_raman = res_raman.reshape((y_dim,i,3))
+    x = res_raman[:,:,0]
+    y = res_raman[:,:,1]
+    z = res_raman[:,:,2]
     return x,y,z
 
 def get_RIXS_iter_all(filedir,edge="L",pvin="XYZ",pvout="XYZ",cross=False):
@@ -80,23 +95,30 @@ def get_RIXS_iter_all(filedir,edge="L",pvin="XYZ",pvout="XYZ",cross=False):
         pvin/pvout: Incoming and outgoing polarization
         cross: Cross polarization, if True then X->X, Y->Y and Z->Z are not considered
     """
-    xsum = None
-    ysum = None
-    zsum = None
+    fnames = []
     for pin in pvin:
         for pout in pvout:
             if (cross and pin == pout): continue
             fname = filedir + "/RIXS_"+edge+"edge_"+pin+"_"+pout+".txt"
             if (Path(fname).exists() and Path(fname).is_file()):
-                x,y,z = _get_RIXS_iter(fname)
-                xsum = x
-                ysum = y
-                if (zsum is None): zsum = z
-                else: zsum += z
+                fnames.append(fname)
             else:
                 raise RuntimeError(f"RIXS file does not exist: {fname}, \
                     with polarization: {str(pin)},{str(pout)}")
-    return xsum,ysum,zsum
+    return _cached_RIXS_iter_all(tuple(fnames),_mtime_signature(fnames))
+
+@functools.lru_cache(maxsize=32)
+def _cached_RIXS_iter_all(fnames,mtime_sig):
+    xsum = None
+    ysum = None
+    zsum = None
+    for fname in fnames:
+        x,y,z = _get_RIXS_iter(fname)
+        xsum = x
+        ysum = y
+        if (zsum is None): zsum = z
+        else: zsum += z
+    return _freeze(xsum,ysum,zsum)
 
 def set_mpl_style():
     # My personal style preference for matplotlib
@@ -11,25 +11,24 @@ def extract_occupation(filename):
     """
     result = {}
     orbitals = {}
+    in_orbitals = False
     with open(filename, "r") as f:
-        lines = f.readlines()
-    
-    # Find the line with "Num Holes"
-    for i, line in enumerate(lines):
-        if "Num Holes" in line:
-            result["Num Holes"] = int(line.split(":")[1].strip())
-            j = i + 1
-            while j < len(lines):
-                l = lines[j].strip()
-                if l[0] ==  "-":
-                    break  # stop at line break
-                parts = l.split()
-                if len(parts) == 2:
-                    orb, val = parts
-                    orbitals[orb] = float(val)
-                j += 1
-            break
-    
+        for line in f:
+            # Find the line with "Num Holes", orbitals follow it
+            if not in_orbitals:
+                if "Num Holes" in line:
+                    _, _, rhs = line.partition(":")
+                    result["Num Holes"] = int(rhs)
+                    in_orbitals = True
+                continue
+            l = line.strip()
+            if not l or l.startswith("-"):
+                break  # stop at line break or end of block
+            parts = l.split()
+            if len(parts) == 2:
+                orb, val = parts
+                orbitals[orb] = float(val)
+
     result["orbitals"] = orbitals
     return result
 
@@ -45,7 +44,7 @@ def extract_ground_state(filename):
                 # Split by comma and parse each state
                 state_dict = {}
                 for item in rest.split(","):
-                    key, val = item.split(":")
-                    state_dict[key.strip()] = float(val.strip())
+                    key, _, val = item.partition(":")
+                    state_dict[key.strip()] = float(val)
                 return state_dict
     return {}
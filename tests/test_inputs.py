@@ -0,0 +1,98 @@
+import pytest
+from pydantic import ValidationError
+
+from src.inputs import (
+    CellParams, InputParams, build_params, create_multiplet_input, get_dParams,
+    load_input_params,
+)
+
+
+# INPUT file for Fe 3+ with every other parameter left at its default
+FE3_INPUT = """&CONTROL
+	HFSCALE = 0.8
+	DIAG = 4
+	OVERWRITE = False
+	EFFDEL = True
+	CF = 0 0 1 1 1
+	EXNEV = 10
+	GSNEV = 10
+	SO = 8.199 0.074 0
+	SC2 = 4.5 0.0 12.042 0.0 7.534
+	SC2EX = 4.5 0.0 12.817 0.0 8.023
+	FG = 4.5 5.563 8.199 3.165
+/
+
+&CELL
+	COORDINATION = ""
+	SITES = 1
+	HYBMAT = ""
+	HOLES = 5
+/
+
+&PHOTON
+	XAS = True
+	RIXS = False
+	PVIN = 1 1 1
+	PVOUT = 1 1 1
+	SOLVER = 4
+	EPSAB = 0.5
+	EPSLOSS = 0.3
+	NITERCFE = 120
+	CGTOL = 1e-08
+	PRECOND = 0
+	NEDOS = 2000
+	AB = -20 20
+	ABMAX = 30
+	INCIDENT = 8 21 -1
+	CROSS = False
+	EDGE = L
+/
+"""
+
+
+def _line(text, key):
+    return next(l for l in text.splitlines() if l.startswith(f"\t{key} = "))
+
+
+def _generate(element, valence, input_params=None):
+    # Same steps as the generate_multiplet_input MCP tool
+    input_params = InputParams() if input_params is None else input_params.model_copy()
+    holes, dcontrol = get_dParams(element, valence)
+    input_params.CELL = input_params.CELL.model_copy(update={"Holes": holes})
+    input_params.CONTROL = input_params.CONTROL.model_copy(update=dcontrol)
+    return create_multiplet_input(input_params)
+
+
+def test_generated_input_for_one_ion():
+    assert _generate("Fe", 3) == FE3_INPUT
+
+
+def test_signed_zero_is_not_served_from_cache():
+    # 0.0 == -0.0 and they hash the same, but are written differently
+    for epsab in (0.0, -0.0, 0.0):
+        text = create_multiplet_input(InputParams(PHOTON={"epsab": epsab}))
+        assert _line(text, "EPSAB") == f"\tEPSAB = {epsab}"
+
+
+def test_user_value_keeps_its_own_type():
+    # Validated floats equal the integer default but must not reuse its line
+    assert _line(create_multiplet_input(InputParams()), "CF") == "\tCF = 0 0 1 1 1"
+    text = create_multiplet_input(InputParams(CONTROL={"CF": [0, 0, 1, 1, 1]}))
+    assert _line(text, "CF") == "\tCF = 0.0 0.0 1.0 1.0 1.0"
+
+
+def test_build_params_matches_validated_params():
+    expected = InputParams(CELL={"Holes": 5}, PHOTON={"RIXS": True})
+    params = build_params(CELL=CellParams(Holes=5), PHOTON={"RIXS": True})
+    assert params == expected
+    assert create_multiplet_input(params) == create_multiplet_input(expected)
+
+
+def test_load_input_params_from_json():
+    raw = b'{"CONTROL": {"CF": [0, 0, 2, 2, 2]}, "PHOTON": {"XAS": false, "RIXS": true}}'
+    params = load_input_params(raw)
+    assert params == InputParams(CONTROL={"CF": [0, 0, 2, 2, 2]}, PHOTON={"XAS": False, "RIXS": True})
+    assert params.CONTROL.CF == (0.0, 0.0, 2.0, 2.0, 2.0)
+    assert load_input_params(raw.decode()) == params
+    with pytest.raises(ValidationError):
+        load_input_params('{"PHOTON": {"bogus": 1}}')
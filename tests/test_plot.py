@@ -0,0 +1,31 @@
+import numpy as np
+
+from src.plot import read_dir_xas
+
+
+def _write_xas(dir_name, pol, x, y):
+    # Same layout as the CTHFAM output: a header line, then energy and intensity
+    np.savetxt(dir_name / f"XAS_Ledge_{pol}.txt", np.column_stack((x, y)),
+               header="Energy Intensity", comments="")
+
+
+def _write_xyz(dir_name):
+    x = np.linspace(-5, 5, 11)
+    spectra = {"X": np.exp(-x**2), "Y": 2*np.exp(-(x-1)**2), "Z": 3*np.exp(-(x+1)**2)}
+    for pol, y in spectra.items():
+        _write_xas(dir_name, pol, x, y)
+    return x, spectra
+
+
+def test_read_dir_xas_sums_all_polarizations(tmp_path):
+    x, spectra = _write_xyz(tmp_path)
+    xdata, ydata = read_dir_xas(str(tmp_path), pol="XYZ")
+    np.testing.assert_allclose(xdata, x)
+    np.testing.assert_allclose(ydata, spectra["X"] + spectra["Y"] + spectra["Z"])
+
+
+def test_read_dir_xas_single_polarization(tmp_path):
+    x, spectra = _write_xyz(tmp_path)
+    xdata, ydata = read_dir_xas(str(tmp_path), pol="X")
+    np.testing.assert_allclose(xdata, x)
+    np.testing.assert_allclose(ydata, spectra["X"])